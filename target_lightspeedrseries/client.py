@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import logging
+import threading
 import time
 from datetime import datetime
 from email.utils import parsedate_to_datetime
@@ -10,7 +12,9 @@ from typing import Dict, List, Optional
 
 import backoff
 import requests
-from singer_sdk.exceptions import RetriableAPIError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from singer_sdk.exceptions import FatalAPIError, RetriableAPIError
 from singer_sdk.plugin_base import PluginBase
 from singer_sdk.sinks import RecordSink
 from target_hotglue.client import HotglueSink
@@ -32,9 +36,22 @@ class LightspeedRSeriesSink(HotglueSink, RecordSink):
     DEFAULT_BASE_URL = "https://api.lightspeedapp.com"
     DEFAULT_AUTH_ENDPOINT = "https://cloud.lightspeedapp.com/auth/oauth/token"
 
-    # Class-level rate limiting state (shared across all instances)
+    # Connection pool sizes, large enough for concurrent OrderLine requests
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 32
+    # Connection retries; 429s and API errors are handled by validate_response
+    CONNECTION_RETRIES = 3
+    CONNECTION_BACKOFF_FACTOR = 0.2
+
+    # Class-level rate limiting state (shared across all instances and threads)
     _last_request_time: float = 0.0
     _min_request_interval: float = 0.5
+    _rate_limit_lock = threading.Lock()
+    # Serializes token refreshes when requests run in worker threads
+    _auth_lock = threading.Lock()
+
+    # Class-level HTTP session so connections (and TLS handshakes) are reused
+    _session: Optional[requests.Session] = None
 
     def __init__(
         self,
@@ -55,6 +72,32 @@ class LightspeedRSeriesSink(HotglueSink, RecordSink):
         if not hasattr(LightspeedRSeriesSink, '_min_request_interval'):
             LightspeedRSeriesSink._min_request_interval = self.MIN_REQUEST_INTERVAL
 
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Get the shared HTTP session, creating it on first use."""
+        if LightspeedRSeriesSink._session is None:
+            session = requests.Session()
+            # Only retry when the connection could not be established. Read,
+            # "other" (e.g. SSL errors while reading the response) and status
+            # retries are disabled, so a POST that may have reached the API is
+            # never sent twice
+            retries = Retry(
+                total=cls.CONNECTION_RETRIES,
+                read=0,
+                status=0,
+                other=0,
+                backoff_factor=cls.CONNECTION_BACKOFF_FACTOR,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=cls.POOL_CONNECTIONS,
+                pool_maxsize=cls.POOL_MAXSIZE,
+                max_retries=retries,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            LightspeedRSeriesSink._session = session
+        return LightspeedRSeriesSink._session
+
     @property
     def base_url(self) -> str:
         """Get the base URL for API requests."""
@@ -74,25 +117,30 @@ class LightspeedRSeriesSink(HotglueSink, RecordSink):
         if "user_agent" in self.config:
             headers["User-Agent"] = self.config.get("user_agent")
         
-        auth_headers = self.authenticator.auth_headers
+        with LightspeedRSeriesSink._auth_lock:
+            auth_headers = self.authenticator.auth_headers
         headers.update(auth_headers)
         
         return headers
 
     def _rate_limit(self) -> None:
-        """Enforce rate limiting: max 3 requests per second."""
-        current_time = time.time()
-        time_since_last_request = current_time - LightspeedRSeriesSink._last_request_time
+        """Enforce rate limiting: max 3 requests per second.
+
+        Each caller reserves the next free request slot under a lock, so
+        concurrent threads are spaced by the minimum interval.
+        """
+        with LightspeedRSeriesSink._rate_limit_lock:
+            current_time = time.time()
+            time_since_last_request = current_time - LightspeedRSeriesSink._last_request_time
+            sleep_time = max(0.0, LightspeedRSeriesSink._min_request_interval - time_since_last_request)
+            LightspeedRSeriesSink._last_request_time = current_time + sleep_time
         
-        if time_since_last_request < LightspeedRSeriesSink._min_request_interval:
-            sleep_time = LightspeedRSeriesSink._min_request_interval - time_since_last_request
+        if sleep_time > 0:
             self.logger.info(
                 f"Rate limiting: sleeping {sleep_time:.3f}s to maintain < {self.RATE_LIMIT_REQUESTS_PER_SECOND} req/s "
                 f"(last request was {time_since_last_request:.3f}s ago, need {LightspeedRSeriesSink._min_request_interval}s)"
             )
             time.sleep(sleep_time)
-        
-        # Note: _last_request_time is updated AFTER the request completes in _request()
     
     def _parse_retry_after(self, retry_after: Optional[str]) -> int:
         if not retry_after:
@@ -118,6 +166,14 @@ class LightspeedRSeriesSink(HotglueSink, RecordSink):
         retry_after = response.headers.get("Retry-After")
         wait_time = self._parse_retry_after(retry_after)
         
+        # Hold back every thread, not just this one: the rate limit applies to
+        # the whole account, so other workers would only hit 429s as well
+        with LightspeedRSeriesSink._rate_limit_lock:
+            LightspeedRSeriesSink._last_request_time = max(
+                LightspeedRSeriesSink._last_request_time,
+                time.time() + wait_time,
+            )
+        
         self.logger.warning(
             f"Rate limit exceeded (429). Waiting {wait_time}s before retry. "
             f"Retry-After header: {retry_after}"
@@ -133,7 +189,13 @@ class LightspeedRSeriesSink(HotglueSink, RecordSink):
         if response.status_code == 429:
             self._handle_429_response(response)
         
-        super().validate_response(response)
+        try:
+            super().validate_response(response)
+        except FatalAPIError as error:
+            # Keep the response so callers can inspect the status code and body
+            if getattr(error, "response", None) is None:
+                error.response = response
+            raise
 
     def _build_request_url(self, endpoint: str) -> str:
         """Build the full URL for an API request."""
@@ -141,6 +203,15 @@ class LightspeedRSeriesSink(HotglueSink, RecordSink):
             return f"{self.url}{endpoint}"
         return f"{self.url}/{endpoint}"
 
+    @staticmethod
+    def _truncated_body(response: requests.Response, limit: int = 1000) -> str:
+        """Return at most `limit` bytes of the response body, decoded for logging.
+
+        Slicing the raw bytes before decoding avoids decoding the whole body
+        just to keep its first part.
+        """
+        return response.content[:limit].decode("utf-8", errors="replace")
+
     def _log_request(
         self,
         http_method: str,
@@ -151,17 +222,17 @@ class LightspeedRSeriesSink(HotglueSink, RecordSink):
     ) -> None:
         """Log request details."""
         self.logger.info(
-            f"Making request to endpoint='{endpoint}' with method: '{http_method}' "
-            f"and url='{url}'"
+            "Making request to endpoint='%s' with method: '%s' and url='%s'",
+            endpoint, http_method, url,
         )
         if request_data:
-            self.logger.info(f"Request payload: {request_data}")
+            self.logger.info("Request payload: %s", request_data)
         if params:
-            self.logger.info(f"Request params: {params}")
+            self.logger.info("Request params: %s", params)
 
     def _log_response(self, response: requests.Response) -> None:
         """Log response details."""
-        self.logger.info(f"Response status: {response.status_code}")
+        self.logger.info("Response status: %s", response.status_code)
         
         if response.status_code >= 400:
             self._log_error_response(response)
@@ -177,17 +248,19 @@ class LightspeedRSeriesSink(HotglueSink, RecordSink):
             error_response = response.json()
             self.logger.error(f"Error response (JSON): {json.dumps(error_response, indent=2)}")
         except Exception:
-            self.logger.error(f"Error response (text, first 2000 chars): {response.text[:2000]}")
+            self.logger.error(f"Error response (text, first 2000 bytes): {self._truncated_body(response, 2000)}")
         self.logger.error(f"Response headers: {dict(response.headers)}")
         self.logger.error("=" * 80)
 
     def _log_success_response(self, response: requests.Response) -> None:
         """Log successful response details."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         try:
             response_data = response.json()
             self.logger.debug(f"Response data: {str(response_data)[:200]}")
         except Exception:
-            self.logger.debug(f"Response text: {response.text[:200]}")
+            self.logger.debug(f"Response text: {self._truncated_body(response, 200)}")
     
     @backoff.on_exception(
         backoff.expo,
@@ -209,13 +282,13 @@ class LightspeedRSeriesSink(HotglueSink, RecordSink):
         self._rate_limit()
         
         url = self._build_request_url(endpoint)
-        request_headers = self.http_headers.copy()
+        request_headers = self.http_headers
         if headers:
             request_headers.update(headers)
 
         self._log_request(http_method, endpoint, url, params, request_data)
 
-        response = requests.request(
+        response = self._get_session().request(
             method=http_method,
             url=url,
             params=params,
@@ -223,10 +296,6 @@ class LightspeedRSeriesSink(HotglueSink, RecordSink):
             json=request_data,
         )
         
-        # Update timestamp AFTER the request completes
-        # This ensures we track when we actually made the request, accounting for request duration
-        LightspeedRSeriesSink._last_request_time = time.time()
-        
         self._log_response(response)
         self.validate_response(response)
         return response
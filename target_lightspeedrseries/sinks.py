@@ -2,78 +2,183 @@
 
 from __future__ import annotations
 import json
+import logging
+import re
+import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import repeat
 from typing import Tuple, List, Dict, Any, Optional
+from singer_sdk.exceptions import FatalAPIError
 from target_lightspeedrseries.client import LightspeedRSeriesSink
 import singer
 
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = datetime.fromisoformat
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 LOGGER = singer.get_logger()
 
+_UTC = timezone.utc
+# Date-only or date-time ISO8601 strings; anything else is not parsed
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]|$)")
+
+
+# Digit runs long enough to overflow a 64-bit integer; orjson decodes such
+# integers as (lossy) floats instead of raising, json.loads keeps them exact
+_WIDE_INT_RE = re.compile(r"\d{19,}")
+
+
+def _json_loads(data: str) -> Any:
+    """Decode a JSON string, falling back to the stdlib where orjson falls short."""
+    if orjson is not None and not _WIDE_INT_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity literals, which the stdlib accepts; genuinely
+            # invalid input raises json.JSONDecodeError again below
+            pass
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> str:
+    """Serialize data to a JSON string for logging, stringifying unknown types."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits, which orjson rejects
+            pass
+    return json.dumps(data, default=str)
+
+
+@lru_cache(maxsize=4096)
+def _format_date_str(date_value: str) -> str:
+    """Normalize an ISO8601 date string to include a timezone.
+
+    Cached because records in a batch often share the same dates.
+    """
+    # Handle ISO format with timezone, checking only the suffix
+    if date_value.endswith("Z"):
+        # Replace Z with +00:00
+        return date_value[:-1] + "+00:00"
+    offset = date_value[-6:]
+    if len(offset) == 6 and offset[0] in "+-" and offset[3] == ":":
+        # It's an ISO string with a ±HH:MM offset, return as is
+        return date_value
+    elif not _ISO_DATE_RE.match(date_value):
+        # Not an ISO date, return as is without attempting to parse
+        return date_value
+    else:
+        # No timezone, assume UTC and add +00:00
+        # Try to parse and add timezone
+        try:
+            dt = parse_datetime(date_value)
+        except (ValueError, TypeError):
+            # If parsing fails (e.g. out-of-range values), return as is
+            return date_value
+        # Add UTC timezone if not present
+        return (dt if dt.tzinfo else dt.replace(tzinfo=_UTC)).isoformat()
+
+
+def _format_datetime(date_value: datetime) -> str:
+    """Convert a datetime to ISO8601, assuming UTC when it is naive."""
+    if date_value.tzinfo is None:
+        # Add UTC timezone if not present
+        date_value = date_value.replace(tzinfo=_UTC)
+    return date_value.isoformat()
+
+
+# Date formatters keyed by exact type
+_DATE_HANDLERS = {
+    str: _format_date_str,
+    datetime: _format_datetime,
+}
+
+
+def _format_date(date_value: Any) -> Optional[str]:
+    """Convert date value to ISO8601 string format with timezone.
+    
+    Formats dates as ISO8601 with timezone (e.g., "2025-12-05T08:55:00+00:00").
+    
+    Args:
+        date_value: Can be a datetime object, ISO string, or None
+        
+    Returns:
+        ISO8601 formatted string with timezone or None
+    """
+    if date_value is None:
+        return None
+    
+    handler = _DATE_HANDLERS.get(type(date_value))
+    if handler is None:
+        # Subclasses (e.g. pandas Timestamp) miss the exact-type lookup
+        if isinstance(date_value, str):
+            handler = _format_date_str
+        elif isinstance(date_value, datetime):
+            handler = _format_datetime
+        else:
+            # For any other type, convert to string
+            handler = str
+    
+    try:
+        return handler(date_value)
+    except Exception as e:
+        LOGGER.warning(f"Failed to format date '{date_value}': {e}, using string conversion")
+        return str(date_value)
+
+
+# Payload fields resolved from the first truthy source key, in order of
+# preference: (payload key, source keys, transform applied to each source value)
+_FIELD_MAP = (
+    ("refNum", ("BuyOrder.ID", "id", "externalid", "refNum"), None),
+    ("orderedDate", ("OrderDate", "transaction_date", "orderedDate"), _format_date),
+    ("arrivalDate", ("expectedDeliveryDate", "created_at", "arrivalDate"), _format_date),
+    ("vendorID", ("SupplierRemoteId", "supplier_remoteId", "vendorID"), None),
+)
+
+# Optional fields copied when truthy (strings)
+_TRUTHY_FIELDS = ("shipInstructions", "stockInstructions")
+# Optional fields copied when not None (numbers that can be 0)
+_NONNULL_FIELDS = ("shipCost", "otherCost", "discount")
+
+
 class BuyOrders(LightspeedRSeriesSink):
     """Order sink for LightspeedRSeries."""
     
     name = "BuyOrders"
     endpoint = "/Order.json"
     
-    def _format_date(self, date_value: Any) -> Optional[str]:
-        """Convert date value to ISO8601 string format with timezone.
-        
-        Formats dates as ISO8601 with timezone (e.g., "2025-12-05T08:55:00+00:00").
-        
-        Args:
-            date_value: Can be a datetime object, ISO string, or None
-            
-        Returns:
-            ISO8601 formatted string with timezone or None
-        """
-        if date_value is None:
-            return None
-        
-        try:
-            if isinstance(date_value, str):
-                # If it's already a string, try to parse and normalize it
-                # Handle ISO format with timezone
-                if "Z" in date_value:
-                    # Replace Z with +00:00
-                    return date_value.replace("Z", "+00:00")
-                elif "+" in date_value or date_value.count("-") > 2:
-                    # It's an ISO string with timezone, return as is
-                    return date_value
-                else:
-                    # No timezone, assume UTC and add +00:00
-                    # Try to parse and add timezone
-                    try:
-                        dt = datetime.fromisoformat(date_value)
-                        if dt.tzinfo is None:
-                            # Add UTC timezone
-                            dt = dt.replace(tzinfo=timezone.utc)
-                        return dt.isoformat()
-                    except:
-                        # If parsing fails, return as is
-                        return date_value
-            elif isinstance(date_value, datetime):
-                # If it's a datetime object, convert to ISO format with timezone
-                dt = date_value
-                if dt.tzinfo is None:
-                    # Add UTC timezone if not present
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt.isoformat()
-            else:
-                # For any other type, convert to string
-                return str(date_value)
-        except Exception as e:
-            LOGGER.warning(f"Failed to format date '{date_value}': {e}, using string conversion")
-            return str(date_value)
+    # Default number of OrderLines created in parallel per order
+    DEFAULT_ORDERLINE_CONCURRENCY = 8
+    
+    @property
+    def orderline_concurrency(self) -> int:
+        """Number of OrderLines created in parallel, at least 1."""
+        concurrency = self.config.get("orderline_concurrency") or self.DEFAULT_ORDERLINE_CONCURRENCY
+        return max(1, int(concurrency))
     
     def _parse_line_items(self, line_items_field: Any) -> List[Dict[str, Any]]:
         """Parse line_items from JSON string or return as list."""
         if not line_items_field:
             return []
         if isinstance(line_items_field, str):
+            # Only a JSON array can hold line items; skip decoding anything else
+            if line_items_field[:1] != "[" and line_items_field.lstrip()[:1] != "[":
+                LOGGER.warning(f"line_items is not a JSON array: {line_items_field[:100]}")
+                return []
             try:
-                return json.loads(line_items_field)
+                return _json_loads(line_items_field)
             except json.JSONDecodeError:
-                LOGGER.warning(f"Failed to parse line_items as JSON: {line_items_field[:100] if len(str(line_items_field)) > 100 else line_items_field}")
+                LOGGER.warning(f"Failed to parse line_items as JSON: {line_items_field[:100]}")
                 return []
         if isinstance(line_items_field, list):
             return line_items_field
@@ -81,65 +186,165 @@ class BuyOrders(LightspeedRSeriesSink):
     
     def preprocess_record(self, record: dict, context: dict) -> dict:
         """Prepare the Order payload and store line items for later processing."""
-        line_items = self._parse_line_items(record.get("line_items"))
+        get = record.get
+        line_items = self._parse_line_items(get("line_items"))
         payload = {}
         
         # Mapping Payload from records
-        refNum = (
-            record.get("BuyOrder.ID") or
-            record.get("id") or
-            record.get("externalid") or
-            record.get("refNum")
-        )
-        if refNum is not None:
-            payload["refNum"] = str(refNum)
-        
-        orderedDate = (
-            self._format_date(record.get("OrderDate")) or
-            self._format_date(record.get("transaction_date")) or
-            self._format_date(record.get("orderedDate"))
-        )
-        if orderedDate is not None:
-            payload["orderedDate"] = str(orderedDate)
-        
-        arrivalDate = (
-            self._format_date(record.get("expectedDeliveryDate")) or
-            self._format_date(record.get("created_at")) or
-            self._format_date(record.get("arrivalDate"))
-        )   
-        if arrivalDate is not None:
-            payload["arrivalDate"] = str(arrivalDate)
-        
-        vendorID = (
-            record.get("SupplierRemoteId") or
-            record.get("supplier_remoteId") or
-            record.get("vendorID")
-        )
-        if vendorID is not None:
-            payload["vendorID"] = str(vendorID)
+        for output_key, input_keys, transform in _FIELD_MAP:
+            value = None
+            for input_key in input_keys:
+                value = get(input_key)
+                if value is not None and transform is not None:
+                    value = transform(value)
+                if value:
+                    break
+            if value is not None:
+                payload[output_key] = str(value)
         
         # Map shopID (from record or config using export_buyOrder_shopid flag)
-        shop_id = record.get("shopID") or self.config.get("buyorders_shop_id")
+        shop_id = get("shopID") or self.config.get("buyorders_shop_id")
         if not shop_id:
             raise ValueError("shopID is required but not found in record or config (buyorders_shop_id)")
         
         payload["shopID"] = str(shop_id)
         
         # Optional fields (truthy check for strings)
-        for field in ["shipInstructions", "stockInstructions"]:
-            value = record.get(field)
+        for field in _TRUTHY_FIELDS:
+            value = get(field)
             if value:
                 payload[field] = value
         
         # Optional fields (explicit None check for numbers that can be 0)
-        for field in ["shipCost", "otherCost", "discount"]:
-            value = record.get(field)
+        for field in _NONNULL_FIELDS:
+            value = get(field)
             if value is not None:
                 payload[field] = value
         
         payload["_line_items"] = line_items
         return payload
     
+    def _build_order_line_payload(self, order_id: Optional[str], line_item: Dict[str, Any]) -> Dict[str, str]:
+        """Build the OrderLine payload for a single line item.
+
+        Pass order_id=None for lines embedded in the Order payload itself.
+        """
+        get = line_item.get
+        # Lightspeed API expects all OrderLine fields as strings (per documentation)
+        order_line_payload = {
+            "quantity": str(get("quantity")),
+            "itemID": str(get("productId") or get("product_remoteId")),
+        }
+        if order_id is not None:
+            order_line_payload["orderID"] = order_id
+        
+        price = get("OptiplySupplierProductPrice") or get("price")
+        if price is not None:
+            order_line_payload["price"] = str(price)
+        original_price = get("originalPrice")
+        if original_price is not None:
+            order_line_payload["originalPrice"] = str(original_price)
+        num_received = get("numReceived")
+        if num_received is not None:
+            order_line_payload["numReceived"] = str(num_received)
+        vendor_cost = get("vendorCost")
+        if vendor_cost is not None:
+            order_line_payload["vendorCost"] = str(vendor_cost)
+        
+        return order_line_payload
+    
+    @staticmethod
+    def _get_order_line_records(order_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return the OrderLines loaded with an Order (via load_relations)."""
+        order_lines = order_data.get("OrderLines")
+        if not isinstance(order_lines, dict):
+            return []
+        order_line = order_lines.get("OrderLine")
+        if isinstance(order_line, list):
+            return order_line
+        # A single related record is returned as an object rather than a list
+        return [order_line] if isinstance(order_line, dict) else []
+    
+    def _fetch_order_lines(self, order_id: Any) -> Optional[List[Dict[str, Any]]]:
+        """Fetch the OrderLines of an existing Order, or None if that fails."""
+        try:
+            response = self.request_api(
+                "GET",
+                endpoint=f"/Order/{order_id}.json",
+                params={"load_relations": '["OrderLines"]'},
+            )
+            return self._get_order_line_records(response.json().get("Order", {}))
+        except Exception as e:
+            LOGGER.warning("Could not fetch the OrderLines of Order %s: %s", order_id, e)
+            return None
+    
+    def _find_missing_line_items(
+        self,
+        line_items: List[Dict[str, Any]],
+        existing_lines: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Return the line items that have no matching OrderLine (by itemID)."""
+        existing_item_ids = Counter(str(line.get("itemID")) for line in existing_lines)
+        missing = []
+        for line_item in line_items:
+            item_id = self._build_order_line_payload(None, line_item)["itemID"]
+            if existing_item_ids[item_id] > 0:
+                existing_item_ids[item_id] -= 1
+            else:
+                missing.append(line_item)
+        return missing
+    
+    def _create_order_line(
+        self,
+        idx: int,
+        total: int,
+        order_id: str,
+        line_item: Dict[str, Any],
+    ) -> bool:
+        """Send a single OrderLine to the API and return whether it succeeded.
+
+        Runs in a worker thread, so errors (including malformed line items)
+        are logged here instead of raised.
+        """
+        order_line_payload = None
+        try:
+            order_line_payload = self._build_order_line_payload(order_id, line_item)
+            self.logger.info(
+                "Making request to endpoint='/OrderLine.json' with method: 'POST' "
+                "and payload= %s (OrderLine %d/%d)",
+                order_line_payload, idx + 1, total,
+            )
+            line_response = self.request_api(
+                "POST",
+                endpoint="/OrderLine.json",
+                request_data=order_line_payload
+            )
+            line_response_data = line_response.json()
+            order_line_id = line_response_data.get("OrderLine", {}).get("orderLineID")
+            
+            if order_line_id:
+                self.logger.info("OrderLine %d created successfully with orderLineID: %s", idx + 1, order_line_id)
+            else:
+                LOGGER.warning("OrderLine %d created but no orderLineID in response: %s", idx + 1, line_response_data)
+            return True
+                
+        except Exception as line_error:
+            LOGGER.error(f"Error creating OrderLine {idx + 1}: {line_error}")
+            LOGGER.error(f"Error type: {type(line_error).__name__}")
+            LOGGER.error(f"Line item data: {_json_dumps(line_item)}")
+            LOGGER.error(f"OrderLine payload: {_json_dumps(order_line_payload)}")
+            
+            # Try to get API error response if available
+            if hasattr(line_error, 'response') and line_error.response is not None:
+                try:
+                    error_data = line_error.response.json()
+                    LOGGER.error(f"API Error Response: {_json_dumps(error_data)}")
+                except:
+                    LOGGER.error(f"API Error Response (text): {self._truncated_body(line_error.response)}")
+            
+            LOGGER.error(f"Traceback: {traceback.format_exc()}")
+            return False
+    
     def upsert_record(self, record: dict, context: dict) -> Tuple[Optional[str], bool, dict]:
         """Send the Order and OrderLines to the API and return the result."""
         state_updates = {}
@@ -150,24 +355,74 @@ class BuyOrders(LightspeedRSeriesSink):
         line_items = record.pop("_line_items", [])
         
         try:
-            self.logger.info(
-                f"Making request to endpoint='{self.endpoint}' with method: 'POST' "
-                f"and payload= {record}"
-            )
-            response = self.request_api(
-                "POST",
-                endpoint=self.endpoint,
-                request_data=record
-            )
+            # Resolved before the Order is posted, so a bad setting cannot fail
+            # the record after the Order already exists
+            max_workers = self.orderline_concurrency
+            lines_embedded = False
+            embed_lines = bool(line_items) and self.config.get("embed_order_lines")
+            if embed_lines and not all(isinstance(line_item, dict) for line_item in line_items):
+                # Malformed items would fail the whole Order here; the per-line
+                # path creates the Order and only fails those lines
+                LOGGER.warning(
+                    "line_items contains malformed entries, "
+                    "creating the Order and OrderLines separately"
+                )
+                embed_lines = False
+            
+            if embed_lines:
+                # Create the Order and its OrderLines in a single request
+                build_payload = self._build_order_line_payload
+                order_payload = {
+                    **record,
+                    "OrderLines": {
+                        "OrderLine": [build_payload(None, line_item) for line_item in line_items]
+                    },
+                }
+                self.logger.info(
+                    "Making request to endpoint='%s' with method: 'POST' and payload= %s",
+                    self.endpoint, order_payload,
+                )
+                try:
+                    response = self.request_api(
+                        "POST",
+                        endpoint=self.endpoint,
+                        # Lightspeed omits relations from the response unless asked
+                        params={"load_relations": '["OrderLines"]'},
+                        request_data=order_payload
+                    )
+                    lines_embedded = True
+                except FatalAPIError as embed_error:
+                    # Only a 400 means the embedded payload itself was refused;
+                    # other client errors (auth, not found, ...) are real failures
+                    embed_response = getattr(embed_error, "response", None)
+                    if embed_response is None or embed_response.status_code != 400:
+                        raise
+                    LOGGER.warning(
+                        "Order with embedded OrderLines was rejected (%s), "
+                        "creating the Order and OrderLines separately",
+                        embed_error,
+                    )
+            
+            if not lines_embedded:
+                self.logger.info(
+                    "Making request to endpoint='%s' with method: 'POST' and payload= %s",
+                    self.endpoint, record,
+                )
+                response = self.request_api(
+                    "POST",
+                    endpoint=self.endpoint,
+                    request_data=record
+                )
             
             # Log response details
-            self.logger.info(f"Response status code: {response.status_code}")
+            self.logger.info("Response status code: %s", response.status_code)
             try:
                 response_data = response.json()
-                self.logger.info(f"Full API response: {json.dumps(response_data, default=str)}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Full API response: {_json_dumps(response_data)}")
             except Exception as json_err:
                 self.logger.warning(f"Could not parse response as JSON: {json_err}")
-                self.logger.info(f"Response text: {response.text[:1000]}")
+                self.logger.info(f"Response text: {self._truncated_body(response)}")
                 response_data = {}
             
             order_data = response_data.get("Order", {})
@@ -177,80 +432,76 @@ class BuyOrders(LightspeedRSeriesSink):
                 order_id = response_data.get("orderID") or response_data.get("id")
             
             if not order_id:
-                LOGGER.error(f"No orderID returned from API. Full response: {json.dumps(response_data, default=str)}")
+                LOGGER.error(f"No orderID returned from API. Full response: {_json_dumps(response_data)}")
                 state_updates["error"] = "No orderID in API response"
                 state_updates["api_response"] = response_data
                 return None, False, state_updates
             
-            self.logger.info(f"Order created successfully with orderID: {order_id}")
+            self.logger.info("Order created successfully with orderID: %s", order_id)
             
-            if line_items:
-                self.logger.info(f"Processing {len(line_items)} OrderLine(s) for orderID: {order_id}")
-                lines_success = 0
-                lines_failed = 0
-                
-                for idx, line_item in enumerate(line_items):
-                    try:
-                        # Lightspeed API expects all OrderLine fields as strings (per documentation)
-                        order_line_payload = {
-                            "orderID": str(order_id),
-                            "quantity": str(line_item.get("quantity")),
-                            "itemID": str(line_item.get("productId") or line_item.get("product_remoteId")),
-                        }
-                        
-                        field_mappings = {
-                            "price": line_item.get("OptiplySupplierProductPrice") or line_item.get("price"),
-                            "originalPrice": line_item.get("originalPrice"),
-                            "numReceived": line_item.get("numReceived"),
-                            "vendorCost": line_item.get("vendorCost"),
-                        }
-                        
-                        for field, value in field_mappings.items():
-                            if value is not None:
-                                order_line_payload[field] = str(value)
-                        
-                        self.logger.info(
-                            f"Making request to endpoint='/OrderLine.json' with method: 'POST' "
-                            f"and payload= {order_line_payload} "
-                            f"(OrderLine {idx + 1}/{len(line_items)})"
-                        )
-                        line_response = self.request_api(
-                            "POST",
-                            endpoint="/OrderLine.json",
-                            request_data=order_line_payload
+            if line_items and lines_embedded:
+                lines_created = len(self._get_order_line_records(order_data))
+                if lines_created == len(line_items):
+                    self.logger.info(
+                        "Order %s created with %d embedded OrderLine(s)", order_id, lines_created
+                    )
+                elif lines_created == 0:
+                    # The response may just leave the lines out, so check the Order
+                    # itself and only create the lines that are really missing
+                    existing_lines = self._fetch_order_lines(order_id)
+                    if existing_lines is None:
+                        LOGGER.warning(
+                            "Could not confirm the %d embedded OrderLine(s) of Order %s",
+                            len(line_items), order_id,
                         )
-                        line_response_data = line_response.json()
-                        order_line_id = line_response_data.get("OrderLine", {}).get("orderLineID")
-                        
-                        if order_line_id:
-                            self.logger.info(f"OrderLine {idx + 1} created successfully with orderLineID: {order_line_id}")
-                            lines_success += 1
+                        state_updates["order_lines_unconfirmed"] = {
+                            "expected": len(line_items),
+                            "created": 0,
+                        }
+                    else:
+                        missing_line_items = self._find_missing_line_items(line_items, existing_lines)
+                        if missing_line_items:
+                            LOGGER.warning(
+                                "Order %s is missing %d of its %d embedded OrderLine(s), "
+                                "creating them separately",
+                                order_id, len(missing_line_items), len(line_items),
+                            )
+                            line_items = missing_line_items
+                            lines_embedded = False
                         else:
-                            LOGGER.warning(f"OrderLine {idx + 1} created but no orderLineID in response: {line_response_data}")
-                            lines_success += 1
-                            
-                    except Exception as line_error:
-                        import traceback
-                        LOGGER.error(f"Error creating OrderLine {idx + 1}: {line_error}")
-                        LOGGER.error(f"Error type: {type(line_error).__name__}")
-                        LOGGER.error(f"Line item data: {json.dumps(line_item, default=str)}")
-                        LOGGER.error(f"OrderLine payload: {json.dumps(order_line_payload, default=str)}")
-                        
-                        # Try to get API error response if available
-                        if hasattr(line_error, 'response') and line_error.response is not None:
-                            try:
-                                error_data = line_error.response.json()
-                                LOGGER.error(f"API Error Response: {json.dumps(error_data)}")
-                            except:
-                                LOGGER.error(f"API Error Response (text): {line_error.response.text[:1000]}")
-                        
-                        LOGGER.error(f"Traceback: {traceback.format_exc()}")
-                        lines_failed += 1
-                        continue
+                            self.logger.info(
+                                "Order %s created with %d embedded OrderLine(s)",
+                                order_id, len(line_items),
+                            )
+                else:
+                    LOGGER.warning(
+                        "Order %s created with %d of %d embedded OrderLine(s)",
+                        order_id, lines_created, len(line_items),
+                    )
+                    state_updates["order_lines_unconfirmed"] = {
+                        "expected": len(line_items),
+                        "created": lines_created,
+                    }
+            
+            if line_items and not lines_embedded:
+                num_lines = len(line_items)
+                self.logger.info("Processing %d OrderLine(s) for orderID: %s", num_lines, order_id)
+                order_id_str = str(order_id)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(executor.map(
+                        self._create_order_line,
+                        range(num_lines),
+                        repeat(num_lines),
+                        repeat(order_id_str),
+                        line_items,
+                    ))
+                
+                lines_success = sum(1 for result in results if result)
+                lines_failed = len(results) - lines_success
                 
                 self.logger.info(
-                    f"OrderLines processing complete for orderID {order_id}: "
-                    f"{lines_success} succeeded, {lines_failed} failed"
+                    "OrderLines processing complete for orderID %s: %d succeeded, %d failed",
+                    order_id, lines_success, lines_failed,
                 )
                 
                 if lines_failed > 0:
@@ -262,7 +513,6 @@ class BuyOrders(LightspeedRSeriesSink):
             return str(order_id), True, state_updates
             
         except Exception as e:
-            import traceback
             LOGGER.error("=" * 80)
             LOGGER.error(f"ERROR UPSERTING ORDER")
             LOGGER.error("=" * 80)
@@ -271,7 +521,7 @@ class BuyOrders(LightspeedRSeriesSink):
             
             # Log the payload that caused the error
             try:
-                LOGGER.error(f"Payload that caused error: {json.dumps(record, default=str)}")
+                LOGGER.error(f"Payload that caused error: {_json_dumps(record)}")
             except:
                 LOGGER.error(f"Payload (repr): {repr(record)}")
             
@@ -279,11 +529,12 @@ class BuyOrders(LightspeedRSeriesSink):
             if hasattr(e, 'response') and e.response is not None:
                 try:
                     error_data = e.response.json()
-                    LOGGER.error(f"API Error Response: {json.dumps(error_data)}")
+                    LOGGER.error(f"API Error Response: {_json_dumps(error_data)}")
                     state_updates["api_error_response"] = error_data
                 except:
-                    LOGGER.error(f"API Error Response (text): {e.response.text[:1000]}")
-                    state_updates["api_error_response"] = e.response.text[:1000]
+                    error_text = self._truncated_body(e.response)
+                    LOGGER.error(f"API Error Response (text): {error_text}")
+                    state_updates["api_error_response"] = error_text
             
             LOGGER.error(f"Full Traceback: {traceback.format_exc()}")
             LOGGER.error("=" * 80)
@@ -24,7 +24,9 @@ class TargetLightspeedRSeries(TargetHotglue):
         th.Property( "client_secret", th.StringType, required=True),
         th.Property( "client_id", th.StringType, required=True),
         th.Property( "expires_in", th.IntegerType, required=False),
-        th.Property( "account_ids", th.StringType, required=True)
+        th.Property( "account_ids", th.StringType, required=True),
+        th.Property( "orderline_concurrency", th.IntegerType, required=False),
+        th.Property( "embed_order_lines", th.BooleanType, required=False)
     ).to_dict()
 
 
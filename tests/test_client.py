@@ -0,0 +1,46 @@
+"""Tests for the LightspeedRSeries base sink."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+from singer_sdk.exceptions import RetriableAPIError
+
+from target_lightspeedrseries import client
+from target_lightspeedrseries.client import LightspeedRSeriesSink
+from target_lightspeedrseries.sinks import BuyOrders
+
+
+class FakeResponse:
+    """Minimal stand-in for a 429 requests.Response."""
+
+    status_code = 429
+
+    def __init__(self, retry_after: str) -> None:
+        self.headers = {"Retry-After": retry_after}
+
+
+@pytest.fixture
+def sink(monkeypatch) -> LightspeedRSeriesSink:
+    monkeypatch.setattr(LightspeedRSeriesSink, "_last_request_time", 0.0)
+    # LightspeedRSeriesSink itself is abstract, so use its concrete subclass
+    sink = BuyOrders.__new__(BuyOrders)
+    sink.logger = logging.getLogger("test-target-lightspeedrseries")
+    return sink
+
+
+def test_429_delays_the_shared_rate_limiter(sink, monkeypatch):
+    monkeypatch.setattr(client.time, "time", lambda: 1000.0)
+    monkeypatch.setattr(client.time, "sleep", lambda seconds: None)
+
+    with pytest.raises(RetriableAPIError):
+        sink._handle_429_response(FakeResponse("30"))
+
+    assert LightspeedRSeriesSink._last_request_time == 1030.0
+
+    # Any other worker now has to wait out the Retry-After window
+    sleeps = []
+    monkeypatch.setattr(client.time, "sleep", sleeps.append)
+    sink._rate_limit()
+    assert sleeps == [pytest.approx(30 + LightspeedRSeriesSink._min_request_interval)]
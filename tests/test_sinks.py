@@ -0,0 +1,273 @@
+"""Tests for the BuyOrders sink."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from singer_sdk.exceptions import FatalAPIError
+
+from target_lightspeedrseries.sinks import BuyOrders, _format_date
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, data: dict, status_code: int = 200) -> None:
+        self._data = data
+        self.status_code = status_code
+        self.content = b""
+
+    def json(self) -> dict:
+        return self._data
+
+
+class FakeAPI:
+    """Records calls to request_api and returns canned Lightspeed responses.
+
+    embedded_lines_returned: how many embedded OrderLines the Order response
+    echoes back when load_relations is requested (None echoes all of them).
+    embed_error_status: if set, an Order with embedded OrderLines is refused
+    with this status, the way validate_response raises client errors.
+    existing_item_ids: itemIDs of the OrderLines a GET of the Order returns
+    (None makes the GET fail).
+    """
+
+    def __init__(self, embedded_lines_returned=None, embed_error_status=None) -> None:
+        self.calls = []
+        self.embedded_lines_returned = embedded_lines_returned
+        self.embed_error_status = embed_error_status
+        self.existing_item_ids = []
+        self._lock = threading.Lock()
+
+    def __call__(self, http_method, endpoint, params=None, request_data=None, headers=None):
+        with self._lock:
+            self.calls.append((endpoint, request_data))
+        if http_method == "GET":
+            if self.existing_item_ids is None:
+                raise RuntimeError("GET failed")
+            lines = [{"orderLineID": "1", "itemID": item_id} for item_id in self.existing_item_ids]
+            return FakeResponse({"Order": {"orderID": "42", "OrderLines": {"OrderLine": lines}}})
+        if endpoint == "/Order.json":
+            if "OrderLines" in request_data and self.embed_error_status:
+                error = FatalAPIError(f"{self.embed_error_status} Client Error")
+                error.response = FakeResponse({"message": "refused"}, self.embed_error_status)
+                raise error
+            order = {"orderID": "42"}
+            if "OrderLines" in request_data and params:
+                lines = request_data["OrderLines"]["OrderLine"][:self.embedded_lines_returned]
+                if lines:
+                    order["OrderLines"] = {"OrderLine": lines if len(lines) > 1 else lines[0]}
+            return FakeResponse({"Order": order})
+        return FakeResponse({"OrderLine": {"orderLineID": f"L{request_data['itemID']}"}})
+
+    @property
+    def endpoints(self) -> list:
+        return [endpoint for endpoint, _ in self.calls]
+
+
+@pytest.fixture
+def api() -> FakeAPI:
+    return FakeAPI()
+
+
+@pytest.fixture
+def sink(api: FakeAPI) -> BuyOrders:
+    """A BuyOrders sink with request_api replaced by a fake."""
+    sink = BuyOrders.__new__(BuyOrders)
+    sink._config = {"buyorders_shop_id": "1"}
+    sink.logger = logging.getLogger("test-target-lightspeedrseries")
+    sink.request_api = api
+    return sink
+
+
+def _upsert(sink: BuyOrders, record: dict):
+    return sink.upsert_record(sink.preprocess_record(record, {}), {})
+
+
+def test_upsert_creates_order_and_lines(sink, api):
+    record = {
+        "id": "PO-1",
+        "line_items": '[{"quantity": 1, "productId": 5}, {"quantity": 2, "productId": 6}]',
+    }
+
+    assert _upsert(sink, record) == ("42", True, {})
+    assert api.endpoints.count("/Order.json") == 1
+    assert sorted(data["itemID"] for endpoint, data in api.calls if endpoint == "/OrderLine.json") == ["5", "6"]
+
+
+@pytest.mark.parametrize("concurrency", [-1, 0, "2"])
+def test_orderline_concurrency_is_clamped(sink, api, concurrency):
+    sink._config["orderline_concurrency"] = concurrency
+    record = {
+        "id": "PO-1",
+        "line_items": '[{"quantity": 1, "productId": 5}, {"quantity": 2, "productId": 6}]',
+    }
+
+    assert _upsert(sink, record) == ("42", True, {})
+    assert api.endpoints.count("/OrderLine.json") == 2
+
+
+def test_malformed_line_item_only_fails_that_line(sink, api):
+    record = {
+        "id": "PO-1",
+        "line_items": '[{"quantity": 1, "productId": 5}, null, {"quantity": 2, "productId": 6}]',
+    }
+
+    assert _upsert(sink, record) == ("42", True, {})
+    assert api.endpoints.count("/Order.json") == 1
+    assert sorted(data["itemID"] for endpoint, data in api.calls if endpoint == "/OrderLine.json") == ["5", "6"]
+
+
+TWO_LINES = '[{"quantity": 1, "productId": 5}, {"quantity": 2, "productId": 6}]'
+
+
+def test_embedded_order_lines_all_confirmed(sink, api):
+    sink._config["embed_order_lines"] = True
+
+    assert _upsert(sink, {"id": "PO-1", "line_items": TWO_LINES}) == ("42", True, {})
+    assert api.endpoints == ["/Order.json"]
+
+
+def test_embedded_order_lines_not_echoed_but_present(sink, api):
+    sink._config["embed_order_lines"] = True
+    api.embedded_lines_returned = 0
+    api.existing_item_ids = ["5", "6"]
+
+    assert _upsert(sink, {"id": "PO-1", "line_items": TWO_LINES}) == ("42", True, {})
+    # Confirmed with a GET of the Order, nothing is posted twice
+    assert api.endpoints == ["/Order.json", "/Order/42.json"]
+
+
+def test_embedded_order_lines_not_echoed_and_missing(sink, api):
+    sink._config["embed_order_lines"] = True
+    api.embedded_lines_returned = 0
+    api.existing_item_ids = ["6"]
+
+    assert _upsert(sink, {"id": "PO-1", "line_items": TWO_LINES}) == ("42", True, {})
+    # Only the line the Order is missing is created separately
+    assert api.endpoints == ["/Order.json", "/Order/42.json", "/OrderLine.json"]
+    assert api.calls[-1][1]["itemID"] == "5"
+
+
+def test_embedded_order_lines_not_echoed_and_not_confirmed(sink, api):
+    sink._config["embed_order_lines"] = True
+    api.embedded_lines_returned = 0
+    api.existing_item_ids = None
+
+    order_id, success, state_updates = _upsert(sink, {"id": "PO-1", "line_items": TWO_LINES})
+
+    assert (order_id, success) == ("42", True)
+    assert api.endpoints == ["/Order.json", "/Order/42.json"]
+    assert state_updates["order_lines_unconfirmed"] == {"expected": 2, "created": 0}
+
+
+def test_embedded_order_lines_partially_confirmed(sink, api):
+    sink._config["embed_order_lines"] = True
+    api.embedded_lines_returned = 1
+
+    order_id, success, state_updates = _upsert(sink, {"id": "PO-1", "line_items": TWO_LINES})
+
+    assert (order_id, success) == ("42", True)
+    assert api.endpoints == ["/Order.json"]
+    assert state_updates["order_lines_unconfirmed"] == {"expected": 2, "created": 1}
+
+
+def test_embedded_order_lines_with_malformed_item_use_per_line_path(sink, api):
+    sink._config["embed_order_lines"] = True
+    record = {"id": "PO-1", "line_items": '[{"quantity": 1, "productId": 5}, null]'}
+
+    assert _upsert(sink, record) == ("42", True, {})
+    assert api.endpoints == ["/Order.json", "/OrderLine.json"]
+    assert "OrderLines" not in api.calls[0][1]
+
+
+def test_embedded_order_lines_fall_back_on_400(sink, api):
+    sink._config["embed_order_lines"] = True
+    api.embed_error_status = 400
+
+    assert _upsert(sink, {"id": "PO-1", "line_items": TWO_LINES}) == ("42", True, {})
+    # Embedded attempt, then the plain Order and its lines
+    assert api.endpoints.count("/Order.json") == 2
+    assert "OrderLines" not in api.calls[1][1]
+    assert api.endpoints.count("/OrderLine.json") == 2
+
+
+@pytest.mark.parametrize("status", [401, 403, 404, 422])
+def test_embedded_order_lines_do_not_fall_back_on_other_client_errors(sink, api, status):
+    sink._config["embed_order_lines"] = True
+    api.embed_error_status = status
+
+    order_id, success, state_updates = _upsert(sink, {"id": "PO-1", "line_items": TWO_LINES})
+
+    assert (order_id, success) == (None, False)
+    assert state_updates["error_type"] == "FatalAPIError"
+    assert state_updates["api_error_response"] == {"message": "refused"}
+    assert api.endpoints == ["/Order.json"]
+
+
+@pytest.mark.parametrize(
+    "line_items, expected",
+    [
+        ('[{"quantity": 1}]', [{"quantity": 1}]),
+        ('  [{"quantity": 1}]', [{"quantity": 1}]),
+        ('[{"price": NaN}]', [{"price": float("nan")}]),
+        ('[{"price": Infinity}]', [{"price": float("inf")}]),
+        ('[{"productId": 123456789012345678901234567890}]', [{"productId": 123456789012345678901234567890}]),
+        ('{"quantity": 1}', []),
+        ("[not json", []),
+        ("", []),
+    ],
+)
+def test_parse_line_items(sink, line_items, expected):
+    result = sink._parse_line_items(line_items)
+    # NaN != NaN, so compare via repr
+    assert repr(result) == repr(expected)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        # Strings that already carry a timezone
+        ("2025-12-05T08:55:00Z", "2025-12-05T08:55:00+00:00"),
+        ("2025-12-05T08:55:00+01:00", "2025-12-05T08:55:00+01:00"),
+        ("2025-12-05T08:55:00-05:00", "2025-12-05T08:55:00-05:00"),
+        # Naive strings are parsed and assumed to be UTC
+        ("2025-12-05", "2025-12-05T00:00:00+00:00"),
+        ("2025-12-05T08:55:00", "2025-12-05T08:55:00+00:00"),
+        ("2025-12-05 08:55:00", "2025-12-05T08:55:00+00:00"),
+        ("2025-12-05T08:55:00.123456", "2025-12-05T08:55:00.123456+00:00"),
+        # Anything that cannot be parsed is returned unchanged
+        ("garbage", "garbage"),
+        ("", ""),
+        ("2025-13-05", "2025-13-05"),
+        # datetimes
+        (datetime(2025, 12, 5, 8, 55), "2025-12-05T08:55:00+00:00"),
+        (datetime(2025, 12, 5, 8, 55, tzinfo=timezone(timedelta(hours=2))), "2025-12-05T08:55:00+02:00"),
+        # Other types are converted with str()
+        (date(2025, 12, 5), "2025-12-05"),
+        (12345, "12345"),
+        (None, None),
+    ],
+)
+def test_format_date(value, expected):
+    assert _format_date(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        # Offsets without a colon are normalized
+        ("2025-12-05T08:55:00+0100", "2025-12-05T08:55:00+01:00"),
+        ("2025-12-05T08:55:00+01", "2025-12-05T08:55:00+01:00"),
+        ("2025-12-05T08:55:00z", "2025-12-05T08:55:00+00:00"),
+        # ciso8601 rolls 24:00 over to the next day and keeps microseconds only
+        ("2025-12-05T24:00:00", "2025-12-06T00:00:00+00:00"),
+        ("2025-12-05T08:55:00.1234567", "2025-12-05T08:55:00.123456+00:00"),
+    ],
+)
+def test_format_date_parsed_with_ciso8601(value, expected):
+    pytest.importorskip("ciso8601")
+    assert _format_date(value) == expected